@@ -27,12 +27,7 @@ class BaseDecoder(metaclass=abc.ABCMeta):
         Extract info bits from decoded message due to polar code mask.
 
         """
-        decoded_info = list()
-
-        for i in range(self.N):
-            if self.mask[i] == 1:
-                decoded_info = np.append(decoded_info, decoded[i])
-        return np.array(decoded_info, dtype=np.int8)
+        return np.asarray(decoded)[self.mask == 1].astype(np.int8)
 
 
 class BaseTreeDecoder(metaclass=abc.ABCMeta):
@@ -48,13 +43,26 @@ class BaseTreeDecoder(metaclass=abc.ABCMeta):
         self._decoding_tree = self._setup_decoding_tree()
         self._position = 0
 
+        # The tree is fixed, so its traversals are computed once
+        self._nodes = tuple(PreOrderIter(self._decoding_tree))
+        self._leaves = tuple(self._decoding_tree.leaves)
+        self._leaf_paths = {
+            leaf: tuple(leaf.path[1:]) for leaf in self._leaves
+        }
+
+        # Computed state of the nodes is kept by the decoder and indexed by
+        # the positions of the nodes in pre-order
+        for i, node in enumerate(self._nodes):
+            node._id = i
+        self._computed = np.zeros(len(self._nodes), dtype=bool)
+
     def __call__(self, received_llr: np.array) -> np.array:
         decoded = self.decode(received_llr)
         return self.extract_result(decoded)
 
     @property
     def leaves(self):
-        return self._decoding_tree.leaves
+        return self._leaves
 
     @property
     def root(self):
@@ -85,12 +93,7 @@ class BaseTreeDecoder(metaclass=abc.ABCMeta):
         Extract info bits from decoded message due to polar code mask.
 
         """
-        decoded_info = list()
-
-        for i in range(self.N):
-            if self.mask[i] == 1:
-                decoded_info = np.append(decoded_info, decoded[i])
-        return np.array(decoded_info, dtype=np.int8)
+        return np.asarray(decoded)[self.mask == 1].astype(np.int8)
 
     def _setup_decoding_tree(self, ):
         """Setup decoding tree."""
@@ -107,8 +110,7 @@ class BaseTreeDecoder(metaclass=abc.ABCMeta):
 
     def _reset_tree_computed_state(self):
         """Reset the state of the tree before decoding"""
-        for node in PreOrderIter(self._decoding_tree):
-            node.is_computed = False
+        self._computed.fill(False)
 
     def _set_decoder_state(self, position):
         """Set current state of the decoder."""
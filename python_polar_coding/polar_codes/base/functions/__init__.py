@@ -12,4 +12,4 @@ from .beta_hard import (
 )
 from .beta_soft import compute_beta_soft
 from .encoding import compute_encoding_step
-from .node_types import NodeTypes, get_node_type
+from .node_types import NodeTypes, compute_mask_prefix, get_node_type
@@ -28,9 +28,13 @@ def compute_left_alpha(llr: np.array) -> np.array:
 def compute_right_alpha(llr: np.array, left_beta: np.array) -> np.array:
     """Compute Alpha for right node during SC-based decoding."""
     N = llr.size // 2
-    left = llr[:N]
-    right = llr[N:]
-    return right - (2 * left_beta - 1) * left
+    result = np.empty(N)
+    for i in range(N):
+        if left_beta[i] == 0:
+            result[i] = llr[i + N] + llr[i]
+        else:
+            result[i] = llr[i + N] - llr[i]
+    return result
 
 
 @numba.njit
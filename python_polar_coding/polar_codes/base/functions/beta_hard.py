@@ -134,7 +134,7 @@ _methods_map = {
 
 
 def compute_beta_hard(
-        node_type: str,
+        node_type: NodeTypes,
         llr: np.array,
         mask_steps: int = 0,
         last_chunk_type: int = 0,
@@ -149,8 +149,8 @@ def compute_beta_hard(
 def compute_parent_beta_hard(left: np.array, right: np.array) -> np.array:
     """Compute Beta values for parent Node."""
     N = left.size
-    result = np.zeros(N * 2, dtype=np.int8)
-    result[:N] = (left + right) % 2
+    result = np.empty(N * 2, dtype=np.int8)
+    np.bitwise_xor(left, right, result[:N])
     result[N:] = right
 
     return result
@@ -136,7 +136,7 @@ _methods_map = {
 
 
 def compute_beta_soft(
-        node_type: str,
+        node_type: NodeTypes,
         llr: np.array,
         mask_steps: int = 0,
         last_chunk_type: int = 0,
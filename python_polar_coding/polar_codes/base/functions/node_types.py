@@ -1,18 +1,25 @@
+from enum import IntEnum
+
 import numpy as np
 
 from python_polar_coding.polar_codes.utils import splits
 
 
-class NodeTypes:
-    """Types of decoding nodes."""
-    ZERO = 'ZERO'
-    ONE = 'ONE'
-    SINGLE_PARITY_CHECK = 'SINGLE-PARITY-CHECK'
-    REPETITION = 'REPETITION'
-    G_REPETITION = 'G-REPETITION'
-    RG_PARITY = 'RG-PARITY'
+class NodeTypes(IntEnum):
+    """Types of decoding nodes.
+
+    Types are small integers, so they are compared and hashed as ints and
+    can be passed to compiled code.
 
-    OTHER = 'OTHER'
+    """
+    ZERO = 0
+    ONE = 1
+    SINGLE_PARITY_CHECK = 2
+    REPETITION = 3
+    G_REPETITION = 4
+    RG_PARITY = 5
+
+    OTHER = 6
 
 
 class NodeTypeDetector:
@@ -27,109 +34,131 @@ class NodeTypeDetector:
     def __init__(self, *args, **kwargs):
         self.last_chunk_type = None
         self.mask_steps = None
+        # Numbers of chunks to check for generalized nodes by node size
+        self._chunks_numbers = dict()
 
     def __call__(
             self,
             supported_nodes: list,
             mask: np.array,
             AF: int = 0,
-    ) -> str:
-        """Get type of decoding Node."""
+            mask_prefix: np.array = None,
+    ) -> NodeTypes:
+        """Get type of decoding Node.
+
+        `mask_prefix` is a prefix sum of the mask with leading zero, so the
+        number of ones in any chunk of the mask is computed in O(1). It can
+        be a slice of a prefix sum computed once for a parent mask.
+
+        `mask_steps` and `last_chunk_type` are set only for generalized
+        nodes and are None for other types.
+
+        """
+        self.last_chunk_type = None
+        self.mask_steps = None
         self.N = mask.size
         self.AF = AF
+        self._mask = mask
+        self._prefix = (
+            mask_prefix if mask_prefix is not None
+            else compute_mask_prefix(mask)
+        )
 
         if (NodeTypes.ONE in supported_nodes
-                and self._is_one(mask)):
+                and self._is_one(0, self.N)):
             return NodeTypes.ONE
         if (NodeTypes.ZERO in supported_nodes
-                and self._is_zero(mask)):
+                and self._is_zero(0, self.N)):
             return NodeTypes.ZERO
         if (NodeTypes.SINGLE_PARITY_CHECK in supported_nodes
-                and self._is_single_parity_check(mask)):
+                and self._is_single_parity_check(0, self.N)):
             return NodeTypes.SINGLE_PARITY_CHECK
         if (NodeTypes.REPETITION in supported_nodes
-                and self._is_repetition(mask)):
+                and self._is_repetition(0, self.N)):
             return NodeTypes.REPETITION
         if (NodeTypes.RG_PARITY in supported_nodes
-                and self._is_rg_parity(mask)):
+                and self._is_rg_parity()):
             return NodeTypes.RG_PARITY
         if (NodeTypes.G_REPETITION in supported_nodes
-                and self._is_g_repetition(mask)):
+                and self._is_g_repetition()):
             return NodeTypes.G_REPETITION
 
         return NodeTypes.OTHER
 
-    def _is_one(self, mask: np.array) -> bool:
-        return np.all(mask == 1)
+    def _get_chunks_numbers(self):
+        """Get numbers of chunks T in range [2, 4, ..., N/2]."""
+        if self.N not in self._chunks_numbers:
+            self._chunks_numbers[self.N] = tuple(
+                splits(self.MIN_CHUNKS, self.N // 2)
+            )
+        return self._chunks_numbers[self.N]
+
+    def _count_ones(self, start: int, end: int) -> int:
+        """Number of ones in the chunk [start, end) of the mask."""
+        return self._prefix[end] - self._prefix[start]
 
-    def _is_zero(self, mask: np.array) -> bool:
-        return np.all(mask == 0)
+    def _is_one(self, start: int, end: int) -> bool:
+        return self._count_ones(start, end) == end - start
 
-    def _is_single_parity_check(self, mask: np.array) -> bool:
+    def _is_zero(self, start: int, end: int) -> bool:
+        return self._count_ones(start, end) == 0
+
+    def _is_single_parity_check(self, start: int, end: int) -> bool:
+        size = end - start
         return (
-            mask.size >= self.SPC_MIN_SIZE and
-            mask[0] == 0 and
-            np.sum(mask) == mask.size - 1
+            size >= self.SPC_MIN_SIZE and
+            self._mask[start] == 0 and
+            self._count_ones(start, end) == size - 1
         )
 
-    def _is_repetition(self, mask: np.array) -> bool:
+    def _is_repetition(self, start: int, end: int) -> bool:
         return (
-            mask.size >= self.REPETITION_MIN_SIZE and
-            mask[-1] == 1 and
-            np.sum(mask) == 1
+            end - start >= self.REPETITION_MIN_SIZE and
+            self._mask[end - 1] == 1 and
+            self._count_ones(start, end) == 1
         )
 
-    def _is_g_repetition(self, mask: np.array) -> bool:
+    def _is_g_repetition(self) -> bool:
         """Check the node is Generalized Repetition node.
 
         Based on: https://arxiv.org/pdf/1804.09508.pdf, Section III, A.
 
         """
         # 1. Split mask into T chunks, T in range [2, 4, ..., N/2]
-        for t in splits(self.MIN_CHUNKS, self.N // 2):
-            chunks = np.split(mask, t)
-
-            last = chunks[-1]
-            last_ok = self._is_single_parity_check(last) or self._is_one(last)
-
+        for t in self._get_chunks_numbers():
+            last = self.N - self.N // t
+
+            last_is_one = self._is_one(last, self.N)
+            last_ok = (
+                last_is_one or
+                self._is_single_parity_check(last, self.N)
+            )
             if not last_ok:
                 continue
 
-            others_ok = all(self._is_zero(c) for c in chunks[:-1])
-            if not others_ok:
+            # All the chunks except the last one are zero
+            if not self._is_zero(0, last):
                 continue
 
-            self.last_chunk_type = 1 if self._is_one(last) else 0
+            self.last_chunk_type = 1 if last_is_one else 0
             self.mask_steps = t
             return True
 
         return False
 
-    def _is_rg_parity(self, mask: np.array) -> bool:
+    def _is_rg_parity(self) -> bool:
         """Check the node is Relaxed Generalized Parity Check node.
 
         Based on: https://arxiv.org/pdf/1804.09508.pdf, Section III, B.
 
         """
         # 1. Split mask into T chunks, T in range [2, 4, ..., N/2]
-        for t in splits(self.MIN_CHUNKS, self.N // 2):
-            chunks = np.split(mask, t)
+        for t in self._get_chunks_numbers():
+            step = self.N // t
 
-            first = chunks[0]
-            if not self._is_zero(first):
+            if not self._is_zero(0, step):
                 continue
-
-            ones = 0
-            spcs = 0
-
-            for c in chunks[1:]:
-                if self._is_one(c):
-                    ones += 1
-                elif self._is_single_parity_check(c):
-                    spcs += 1
-
-            others_ok = (ones + spcs + 1) == t and spcs <= self.AF
-            if not others_ok:
+            if not self._are_rg_parity_chunks(step):
                 continue
 
             self.mask_steps = t
@@ -137,5 +166,41 @@ class NodeTypeDetector:
 
         return False
 
+    def _are_rg_parity_chunks(self, step: int) -> bool:
+        """Check all the chunks but the first one of RG-Parity node.
+
+        Each chunk must be One or SPC node, with no more than AF SPC nodes.
+        Chunks are checked by counting ones from the prefix sum, the check
+        stops on the first chunk that does not fit.
+
+        """
+        prefix = self._prefix
+        spc_allowed = step >= self.SPC_MIN_SIZE
+        spcs = 0
+
+        for start in range(step, self.N, step):
+            ones = prefix[start + step] - prefix[start]
+            if ones == step:
+                continue
+
+            is_spc = (
+                spc_allowed and
+                ones == step - 1 and
+                self._mask[start] == 0
+            )
+            if not is_spc:
+                return False
+
+            spcs += 1
+            if spcs > self.AF:
+                return False
+
+        return True
+
+
+def compute_mask_prefix(mask: np.array) -> np.array:
+    """Compute prefix sum of the mask with leading zero."""
+    return np.concatenate(([0], np.cumsum(mask)))
+
 
 get_node_type = NodeTypeDetector()
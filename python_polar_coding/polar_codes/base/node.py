@@ -7,6 +7,7 @@ from .functions import (
     NodeTypes,
     compute_beta_hard,
     compute_beta_soft,
+    compute_mask_prefix,
     get_node_type,
 )
 
@@ -21,9 +22,23 @@ class BaseDecodingNode(Node):
 
     # Supported types of decoding nodes
     supported_nodes: Tuple = None
-
-    def __init__(self, mask: np.array, name: str = ROOT, AF: int = 0, **kwargs):  # noqa
-        """A node of Fast SSC decoder."""
+    # Type of Beta values
+    beta_dtype: np.dtype = np.int8
+
+    def __init__(
+            self,
+            mask: np.array,
+            name: str = ROOT,
+            AF: int = 0,
+            mask_prefix: np.array = None,
+            **kwargs,
+    ):
+        """A node of Fast SSC decoder.
+
+        `mask_prefix` is a prefix sum of the mask shared by all the nodes of
+        the tree, each node gets a slice of its parent's prefix sum.
+
+        """
         if name not in self.__class__.NODE_NAMES:
             raise ValueError('Wrong Fast SSC Node type')
 
@@ -31,15 +46,21 @@ class BaseDecodingNode(Node):
 
         self.mask = mask
         self.AF = AF
+        self._mask_prefix = (
+            mask_prefix if mask_prefix is not None
+            else compute_mask_prefix(mask)
+        )
         self.node_type = get_node_type(
             supported_nodes=self.supported_nodes,
             mask=self.mask,
             AF=self.AF,
+            mask_prefix=self._mask_prefix,
         )
-        self.is_computed = False
 
-        self._alpha = np.zeros(self.N, dtype=np.double)
-        self._beta = np.zeros(self.N, dtype=np.int8)
+        # Alpha and Beta are allocated on first access, so that decoders
+        # can bind them to views of their own arrays instead
+        self._alpha = None
+        self._beta = None
 
         # For generalized decoders
         self.last_chunk_type = get_node_type.last_chunk_type
@@ -57,25 +78,41 @@ class BaseDecodingNode(Node):
     def N(self) -> int:
         return self.mask.size
 
+    @property
+    def level(self) -> int:
+        """Level of the node in the tree, nodes of size 1 have level 0."""
+        return self.N.bit_length() - 1
+
+    @property
+    def offset(self) -> int:
+        """Position of the first bit of the node in the codeword."""
+        if self.is_root:
+            return 0
+        return self.parent.offset + (self.N if self.is_right else 0)
+
     @property
     def alpha(self) -> np.array:
+        if self._alpha is None:
+            self._alpha = np.zeros(self.N, dtype=np.double)
         return self._alpha
 
     @alpha.setter
     def alpha(self, value: np.array):
         if self.mask.size != value.size:
             raise ValueError('Wrong size of LLR vector')
-        self._alpha = np.array(value)
+        self._alpha = np.asarray(value, dtype=np.double)
 
     @property
     def beta(self) -> np.array:
+        if self._beta is None:
+            self._beta = np.zeros(self.N, dtype=self.beta_dtype)
         return self._beta
 
     @beta.setter
     def beta(self, value: np.array):
         if self.mask.size != value.size:
             raise ValueError('Wrong size of Bits vector')
-        self._beta = np.array(value)
+        self._beta = np.asarray(value)
 
     @property
     def is_left(self) -> bool:
@@ -100,10 +137,16 @@ class BaseDecodingNode(Node):
         if self.is_simplified_node:
             return
 
-        left_mask, right_mask = np.split(self.mask, 2)
+        half = self.N // 2
+        left_mask, right_mask = self.mask[:half], self.mask[half:]
+        left_prefix = self._mask_prefix[:half + 1]
+        right_prefix = self._mask_prefix[half:]
+
         cls = self.__class__
-        cls(mask=left_mask, name=self.LEFT, AF=self.AF, parent=self)
-        cls(mask=right_mask, name=self.RIGHT, AF=self.AF, parent=self)
+        cls(mask=left_mask, name=self.LEFT, AF=self.AF,
+            mask_prefix=left_prefix, parent=self)
+        cls(mask=right_mask, name=self.RIGHT, AF=self.AF,
+            mask_prefix=right_prefix, parent=self)
 
     def get_decoding_params(self) -> Dict:
         """Get decoding params to perform the decoding in a leaf node."""
@@ -130,6 +173,9 @@ class HardNode(BaseDecodingNode):
 class SoftNode(BaseDecodingNode):
     """Decoding node for soft decoding methods."""
 
+    # Beta values of soft decoding are LLR
+    beta_dtype: np.dtype = np.double
+
     def __call__(self, *args, **kwargs):
         """Compute beta value of the decoding node."""
 
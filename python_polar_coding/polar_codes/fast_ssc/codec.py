@@ -1,3 +1,5 @@
+from typing import Union
+
 import numpy as np
 
 from python_polar_coding.polar_codes.base import BasePolarCodec
@@ -13,9 +15,50 @@ class FastSSCPolarCodec(BasePolarCodec):
     """
     decoder_class = FastSSCDecoder
 
+    def __init__(
+            self,
+            N: int,
+            K: int,
+            design_snr: float = 0.0,
+            is_systematic: bool = True,
+            mask: Union[str, None] = None,
+            pcc_method: str = BasePolarCodec.BHATTACHARYYA,
+            dtype: np.dtype = np.double,
+            llr_scale: float = FastSSCDecoder.LLR_SCALE,
+    ):
+
+        self.dtype = dtype
+        self.llr_scale = llr_scale
+        super().__init__(
+            N=N,
+            K=K,
+            design_snr=design_snr,
+            is_systematic=is_systematic,
+            mask=mask,
+            pcc_method=pcc_method,
+        )
+
     def init_decoder(self):
-        return self.decoder_class(n=self.n, mask=self.mask)
+        return self.decoder_class(
+            n=self.n,
+            mask=self.mask,
+            dtype=self.dtype,
+            llr_scale=self.llr_scale,
+        )
+
+    def to_dict(self):
+        d = super().to_dict()
+        d.update({
+            'dtype': np.dtype(self.dtype).name,
+            'llr_scale': self.llr_scale,
+        })
+        return d
 
     def decode(self, received_message: np.array) -> np.array:
         """Decode received message presented as LLR values."""
         return self.decoder(received_message)
+
+    def decode_batch(self, received_messages: np.array) -> np.array:
+        """Decode a batch of received messages of shape (B, N)."""
+        decoded = self.decoder.decode_batch(received_messages)
+        return self.decoder.extract_result_batch(decoded)
@@ -0,0 +1,152 @@
+"""Decoder of Fast SSC specialized for the polar code at runtime.
+
+The decoding schedule is fixed by (N, mask), so it can be turned into the
+source of a function with one statement per operation and literal slice
+bounds instead of the opcode dispatch loop of `run_schedule`.
+
+Numba does not cache functions defined by `exec` on disk, so the source
+is written as a module to `CACHE_DIR` and imported, its functions are
+compiled with `cache=True`. The module is named by a hash of its source,
+so it changes along with the code and the kernels it calls.
+
+"""
+import hashlib
+import importlib.util
+import os
+import sys
+from types import ModuleType
+from typing import Dict, Tuple
+
+from .schedule import (
+    ALPHA_LEFT,
+    ALPHA_RIGHT,
+    COMBINE,
+    LEAF_G_REPETITION,
+    LEAF_ONE,
+    LEAF_REPETITION,
+    LEAF_RG_PARITY,
+    LEAF_SINGLE_PARITY_CHECK,
+)
+
+# Directory of generated decoders, set POLAR_CODES_CACHE_DIR to change it
+CACHE_DIR = os.environ.get(
+    'POLAR_CODES_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'python_polar_coding'),
+)
+
+FUNCTION_NAME = 'decode'
+
+_HEADER = '''"""Fast SSC decoder generated by python_polar_coding."""
+import numba
+
+from python_polar_coding.polar_codes.base.functions.beta_hard import (
+    make_hard_decision,
+)
+from python_polar_coding.polar_codes.fast_ssc.functions import (
+    compute_parent_beta,
+    g_repetition,
+    left_alpha_kernel,
+    repetition,
+    rg_parity,
+    right_alpha_kernel,
+    single_parity_check,
+)
+
+
+@numba.njit(cache=True)
+'''
+
+# Generated modules by (n, mask, node types) of the polar code
+_decoders: Dict[Tuple, ModuleType] = dict()
+
+
+def generate_source(schedule: Tuple) -> str:
+    """Generate source of the module with decoding function for the schedule.
+
+    The function takes Alpha and Beta arrays the same way `run_schedule`
+    does.
+
+    """
+    lines = [f'def {FUNCTION_NAME}(alpha, beta):']
+
+    for opcode, level, offset, mask_steps, last_chunk_type in schedule:
+        N = 1 << level
+        end = offset + N
+        node_alpha = f'alpha[{level}, {offset}:{end}]'
+        node_beta = f'beta[{level}, {offset}:{end}]'
+
+        if opcode == ALPHA_LEFT:
+            parent_alpha = f'alpha[{level + 1}, {offset}:{end + N}]'
+            line = f'left_alpha_kernel({parent_alpha}, {node_alpha})'
+        elif opcode == ALPHA_RIGHT:
+            start = offset - N
+            parent_alpha = f'alpha[{level + 1}, {start}:{end}]'
+            left_beta = f'beta[{level}, {start}:{offset}]'
+            line = (f'right_alpha_kernel('
+                    f'{parent_alpha}, {left_beta}, {node_alpha})')
+        elif opcode == COMBINE:
+            middle = offset + N // 2
+            line = (f'compute_parent_beta('
+                    f'beta[{level - 1}, {offset}:{middle}], '
+                    f'beta[{level - 1}, {middle}:{end}], {node_beta})')
+        elif opcode == LEAF_ONE:
+            line = f'{node_beta} = make_hard_decision({node_alpha})'
+        elif opcode == LEAF_SINGLE_PARITY_CHECK:
+            line = f'single_parity_check({node_alpha}, {node_beta})'
+        elif opcode == LEAF_REPETITION:
+            line = f'repetition({node_alpha}, {node_beta})'
+        elif opcode == LEAF_G_REPETITION:
+            line = (f'g_repetition({node_alpha}, {mask_steps}, '
+                    f'{last_chunk_type}, {node_beta})')
+        elif opcode == LEAF_RG_PARITY:
+            line = f'rg_parity({node_alpha}, {mask_steps}, {node_beta})'
+        else:
+            raise ValueError(f'Unknown operation code {opcode}')
+
+        lines.append(f'    {line}')
+
+    # Zero root node has no operations, its Beta is always zeros
+    if not schedule:
+        lines.append('    pass')
+
+    return _HEADER + '\n'.join(lines) + '\n'
+
+
+def load_decoder(schedule: Tuple) -> ModuleType:
+    """Write the decoder module for the schedule if needed and import it."""
+    source = generate_source(schedule)
+    name = 'fast_ssc_' + hashlib.sha1(source.encode()).hexdigest()[:16]
+    path = os.path.join(CACHE_DIR, f'{name}.py')
+
+    if not os.path.exists(path):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first, so that concurrent processes
+        # never import a partially written module
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w') as f:
+            f.write(source)
+        os.replace(temp_path, path)
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    # Numba imports the module by name to load its cached functions
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_decoder(key: Tuple, schedule: Tuple) -> ModuleType:
+    """Get module of decoder for the polar code.
+
+    `key` identifies the code and the types of its decoding tree nodes,
+    the schedule of the same code is not built into a module twice within
+    the process. Compiled functions of the module are cached by Numba on
+    disk.
+
+    """
+    if key not in _decoders:
+        _decoders[key] = load_decoder(schedule)
+    return _decoders[key]
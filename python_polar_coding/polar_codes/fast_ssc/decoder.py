@@ -1,47 +1,154 @@
+import numpy as np
+
 from python_polar_coding.polar_codes.base import BaseTreeDecoder
-from python_polar_coding.polar_codes.base.functions import (
-    compute_left_alpha,
-    compute_parent_beta_hard,
-    compute_right_alpha,
-)
 
+from .codegen import get_decoder
+from .functions import QUANTIZED_LLR_MAX
 from .node import FastSSCNode
+from .schedule import (
+    build_schedule,
+    run_schedule,
+    run_schedule_batch,
+    schedule_to_arrays,
+)
 
 
 class FastSSCDecoder(BaseTreeDecoder):
-    """Implements Fast SSC decoding algorithm."""
+    """Implements Fast SSC decoding algorithm.
+
+    The decoding tree is used only to classify the nodes. Alpha and Beta
+    values of all the nodes are kept in two contiguous arrays indexed by
+    (level, offset) and decoding runs over a flat schedule of operations
+    built once in depth-first order.
+
+    LLR values may be quantized to int8 by passing `dtype=np.int8`. Received
+    LLR are scaled by `llr_scale` (`LLR_SCALE` by default) and saturated to
+    [-LLR_MAX, LLR_MAX] once before decoding.
+
+    Several frames can be decoded by one call of `decode_batch`. Frames are
+    decoded together in chunks of up to `BATCH_SIZE` frames, so the memory
+    for a batch does not grow with its size.
+
+    With `specialize=True` the schedule is compiled into a function with
+    literal offsets of all the operations. The function is cached on disk,
+    but its first compilation takes much longer than decoding.
+
+    """
     node_class = FastSSCNode
 
-    def _compute_intermediate_alpha(self, leaf):
-        """Compute intermediate Alpha values (LLR)."""
-        for node in leaf.path[1:]:
-            if node.is_computed:
-                continue
+    # Default scale and saturation limit for quantized LLR
+    LLR_SCALE = 4
+    LLR_MAX = QUANTIZED_LLR_MAX
+    # Maximal number of frames decoded together by `decode_batch`
+    BATCH_SIZE = 64
 
-            # No need to compute zero node because output is vector of zeros
-            if node.is_zero:
-                continue
+    def __init__(
+            self,
+            n: int,
+            mask: np.array,
+            dtype: np.dtype = np.double,
+            specialize: bool = False,
+            llr_scale: float = LLR_SCALE,
+    ):
+        super().__init__(n=n, mask=mask)
 
-            parent_alpha = node.parent.alpha
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.double, np.int8):
+            raise ValueError('Wrong type of LLR values')
+        self.is_quantized = self.dtype == np.int8
+        self.llr_scale = llr_scale
 
-            if node.is_left:
-                node.alpha = compute_left_alpha(parent_alpha)
-                continue
+        self._alpha = np.zeros((self.n + 1, self.N), dtype=self.dtype)
+        self._beta = np.zeros((self.n + 1, self.N), dtype=np.int8)
+        self._bind_nodes()
+        self._schedule = build_schedule(self._decoding_tree)
+        self._opcodes, self._params = schedule_to_arrays(self._schedule)
+        self._decode_fn = None
+        if specialize:
+            self._decode_fn = get_decoder(
+                self._code_key, self._schedule,
+            ).decode
 
-            left_node = node.siblings[0]
-            left_beta = left_node.beta
-            node.alpha = compute_right_alpha(parent_alpha, left_beta)
-            node.is_computed = True
+        # Alpha and Beta arrays for batch decoding by number of frames,
+        # allocated on demand
+        self._batch_workspaces = dict()
 
-    def _compute_intermediate_beta(self, node):
-        """Compute intermediate Beta values (BIT)."""
-        if node.is_left:
-            return
+    def decode(self, received_llr: np.array) -> np.array:
+        """Implementation of decoding using the compiled flat schedule.
+
+        Returns a new array of decoded bits, the decoder's own Beta values
+        are overwritten by the next call.
+
+        """
+        self._alpha[self.n] = self._prepare_llr(received_llr)
+        if self._decode_fn is not None:
+            self._decode_fn(self._alpha, self._beta)
+        else:
+            run_schedule(self._opcodes, self._params, self._alpha, self._beta)
+        return self.result.copy()
+
+    def decode_batch(self, received_llr: np.array) -> np.array:
+        """Decode a batch of frames given as LLR array of shape (B, N).
 
-        if node.is_root:
-            return
+        Returns a new array of decoded bits of shape (B, N). Batches are
+        decoded by the schedule also when the decoder is specialized.
 
-        parent = node.parent
-        left = node.siblings[0]
-        parent.beta = compute_parent_beta_hard(left.beta, node.beta)
-        return self._compute_intermediate_beta(parent)
+        """
+        received_llr = self._prepare_llr(np.atleast_2d(received_llr))
+        result = np.empty(received_llr.shape, dtype=np.int8)
+
+        for start in range(0, received_llr.shape[0], self.BATCH_SIZE):
+            frames = received_llr[start:start + self.BATCH_SIZE]
+            alpha, beta = self._get_batch_workspace(frames.shape[0])
+
+            alpha[self.n] = frames.T
+            run_schedule_batch(self._opcodes, self._params, alpha, beta)
+            result[start:start + frames.shape[0]] = beta[self.n].T
+
+        return result
+
+    def extract_result_batch(self, decoded: np.array) -> np.array:
+        """Extract info bits from a batch of decoded messages."""
+        return decoded[:, self.mask == 1].astype(np.int8)
+
+    @property
+    def _code_key(self):
+        """Key of the polar code and the types of decoding tree nodes."""
+        return (
+            self.n,
+            np.asarray(self.mask, dtype=np.int8).tobytes(),
+            tuple(node.node_type for node in self._nodes),
+        )
+
+    def _get_batch_workspace(self, size: int):
+        """Get Alpha and Beta arrays of shape (n + 1, N, size)."""
+        if size not in self._batch_workspaces:
+            shape = (self.n + 1, self.N, size)
+            self._batch_workspaces[size] = (
+                np.zeros(shape, dtype=self.dtype),
+                np.zeros(shape, dtype=np.int8),
+            )
+        return self._batch_workspaces[size]
+
+    def _prepare_llr(self, received_llr: np.array) -> np.array:
+        """Quantize received LLR if needed."""
+        if not self.is_quantized:
+            return received_llr
+        return np.clip(
+            np.rint(received_llr * self.llr_scale),
+            -self.LLR_MAX,
+            self.LLR_MAX,
+        )
+
+    def _bind_nodes(self):
+        """Bind Alpha and Beta of the tree nodes to the contiguous arrays."""
+        for node in self._nodes:
+            start, end = node.offset, node.offset + node.N
+            node._alpha = self._alpha[node.level, start:end]
+            node._beta = self._beta[node.level, start:end]
+
+    def _compute_intermediate_alpha(self, leaf):
+        """Alpha values are computed by the decoding schedule."""
+
+    def _compute_intermediate_beta(self, node):
+        """Beta values are computed by the decoding schedule."""
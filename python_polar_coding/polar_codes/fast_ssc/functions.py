@@ -0,0 +1,363 @@
+import numba
+import numpy as np
+from numba import types
+from numba.extending import overload
+
+# Number of int8 bits packed into one uint64 lane
+LANE_SIZE = 8
+# Saturation limit of quantized int8 LLR, -128 is excluded to keep |LLR|
+# representable
+QUANTIZED_LLR_MAX = 127
+# Sign bit and magnitude bits of float64 LLR viewed as uint64
+SIGN_MASK = np.uint64(1 << 63)
+MAGNITUDE_MASK = np.uint64((1 << 63) - 1)
+
+
+@numba.njit(cache=True, fastmath=True)
+def compute_left_alpha(llr: np.array, result: np.array):
+    """Compute Alpha for left node in-place (min-sum f function).
+
+    LLR are float64 values viewed as uint64, so the magnitude is the value
+    without the sign bit and the sign of the result is XOR of the signs.
+    Comparing magnitudes as integers gives the same order as comparing
+    absolute values.
+
+    Based on: https://arxiv.org/pdf/1307.7154.pdf, Section II.
+
+    """
+    N = llr.size // 2
+    bits = llr.view(np.uint64)
+    result_bits = result.view(np.uint64)
+    for i in range(N):
+        a = bits[i]
+        b = bits[i + N]
+        magnitude = min(a & MAGNITUDE_MASK, b & MAGNITUDE_MASK)
+        result_bits[i] = ((a ^ b) & SIGN_MASK) | magnitude
+
+
+@numba.njit(cache=True, fastmath=True)
+def compute_right_alpha(llr: np.array, left_beta: np.array, result: np.array):
+    """Compute Alpha for right node in-place (g function).
+
+    The sign of the left half is selected by the bit instead of being
+    multiplied by (1 - 2 * bit).
+
+    Based on: https://arxiv.org/pdf/1307.7154.pdf, Section II.
+
+    """
+    N = llr.size // 2
+    for i in range(N):
+        if left_beta[i] == 0:
+            result[i] = llr[i + N] + llr[i]
+        else:
+            result[i] = llr[i + N] - llr[i]
+
+
+@numba.njit(cache=True)
+def compute_parent_beta(left: np.array, right: np.array, result: np.array):
+    """Compute Beta values for parent Node in-place.
+
+    Bits are stored as int8, so when the halves are long enough they are
+    processed as uint64 lanes of 8 bits each.
+
+    """
+    N = left.size
+    if N % LANE_SIZE == 0:
+        left_lanes = left.view(np.uint64)
+        right_lanes = right.view(np.uint64)
+        upper_lanes = result[:N].view(np.uint64)
+        lower_lanes = result[N:].view(np.uint64)
+        for i in range(N // LANE_SIZE):
+            upper_lanes[i] = left_lanes[i] ^ right_lanes[i]
+            lower_lanes[i] = right_lanes[i]
+        return
+
+    for i in range(N):
+        result[i] = left[i] ^ right[i]
+        result[i + N] = right[i]
+
+
+@numba.njit(cache=True)
+def compute_left_alpha_quantized(llr: np.array, result: np.array):
+    """Compute Alpha for left node in-place for quantized LLR.
+
+    Branchless min-sum over int8 values: an arithmetic shift by 7 bits
+    gives 0 or -1 for a sign, `| 1` turns XOR of signs into +1 or -1.
+
+    """
+    N = llr.size // 2
+    for i in range(N):
+        a = llr[i]
+        b = llr[i + N]
+        result[i] = (((a >> 7) ^ (b >> 7)) | 1) * min(abs(a), abs(b))
+
+
+@numba.njit(cache=True)
+def compute_right_alpha_quantized(
+        llr: np.array,
+        left_beta: np.array,
+        result: np.array,
+):
+    """Compute Alpha for right node in-place for quantized LLR.
+
+    The sum is computed in int16 and saturated to
+    [-QUANTIZED_LLR_MAX, QUANTIZED_LLR_MAX].
+
+    """
+    N = llr.size // 2
+    for i in range(N):
+        a = np.int16(llr[i])
+        b = np.int16(llr[i + N])
+        value = b + a if left_beta[i] == 0 else b - a
+        result[i] = max(-QUANTIZED_LLR_MAX, min(QUANTIZED_LLR_MAX, value))
+
+
+def left_alpha_kernel(llr: np.array, result: np.array):
+    """Compute Alpha for left node in-place with the kernel for LLR type.
+
+    Inside compiled code the kernel is chosen during compilation.
+
+    """
+    if llr.dtype == np.int8:
+        compute_left_alpha_quantized(llr, result)
+    else:
+        compute_left_alpha(llr, result)
+
+
+def right_alpha_kernel(llr: np.array, left_beta: np.array, result: np.array):
+    """Compute Alpha for right node in-place with the kernel for LLR type.
+
+    Inside compiled code the kernel is chosen during compilation.
+
+    """
+    if llr.dtype == np.int8:
+        compute_right_alpha_quantized(llr, left_beta, result)
+    else:
+        compute_right_alpha(llr, left_beta, result)
+
+
+@overload(left_alpha_kernel)
+def _left_alpha_kernel(llr, result):
+    if llr.dtype == types.int8:
+        return lambda llr, result: compute_left_alpha_quantized(llr, result)
+    return lambda llr, result: compute_left_alpha(llr, result)
+
+
+@overload(right_alpha_kernel)
+def _right_alpha_kernel(llr, left_beta, result):
+    if llr.dtype == types.int8:
+        return lambda llr, left_beta, result: compute_right_alpha_quantized(
+            llr, left_beta, result,
+        )
+    return lambda llr, left_beta, result: compute_right_alpha(
+        llr, left_beta, result,
+    )
+
+
+@numba.njit(cache=True)
+def single_parity_check(llr: np.array, result: np.array):
+    """Compute bits for Single Parity Check node in-place.
+
+    Hard decisions, their parity and the least reliable position are found
+    in a single pass over LLR.
+
+    Based on: https://arxiv.org/pdf/1307.7154.pdf, Section IV, A.
+
+    """
+    parity = 0
+    arg_min = 0
+    min_abs = abs(llr[0])
+    for i in range(llr.size):
+        bit = 1 if llr[i] < 0 else 0
+        result[i] = bit
+        parity ^= bit
+        if abs(llr[i]) < min_abs:
+            min_abs = abs(llr[i])
+            arg_min = i
+    result[arg_min] ^= parity
+
+
+@numba.njit(cache=True)
+def repetition(llr: np.array, result: np.array):
+    """Compute bits for Repetition node in-place.
+
+    Based on: https://arxiv.org/pdf/1307.7154.pdf, Section IV, B.
+
+    """
+    llr_sum = 0.0
+    for i in range(llr.size):
+        llr_sum += llr[i]
+
+    bit = 1 if llr_sum < 0 else 0
+    for i in range(result.size):
+        result[i] = bit
+
+
+@numba.njit(cache=True)
+def g_repetition(
+        llr: np.array,
+        mask_steps: int,
+        last_chunk_type: int,
+        result: np.array,
+):
+    """Compute bits for Generalized Repetition node in-place.
+
+    LLR of the last chunk are summed over the chunks and decoded as One or
+    SPC node in the same pass, then the bits are repeated in all the chunks.
+
+    Based on: https://arxiv.org/pdf/1804.09508.pdf, Section III, A.
+
+    """
+    step = llr.size // mask_steps
+    parity = 0
+    arg_min = 0
+    min_abs = np.inf
+    for i in range(step):
+        llr_sum = 0.0
+        for j in range(mask_steps):
+            llr_sum += llr[i + j * step]
+
+        bit = 1 if llr_sum < 0 else 0
+        result[i] = bit
+        parity ^= bit
+        if abs(llr_sum) < min_abs:
+            min_abs = abs(llr_sum)
+            arg_min = i
+
+    if last_chunk_type != 1:
+        result[arg_min] ^= parity
+
+    for i in range(step, llr.size):
+        result[i] = result[i - step]
+
+
+@numba.njit(cache=True)
+def rg_parity(llr: np.array, mask_steps: int, result: np.array):
+    """Compute bits for Relaxed Generalized Parity Check node in-place.
+
+    Every position of the chunks makes a Single Parity Check code over the
+    chunks, each one is decoded in a single pass over its LLR.
+
+    Based on: https://arxiv.org/pdf/1804.09508.pdf, Section III, B.
+
+    """
+    step = llr.size // mask_steps
+    for i in range(step):
+        parity = 0
+        arg_min = i
+        min_abs = abs(llr[i])
+        for k in range(i, llr.size, step):
+            bit = 1 if llr[k] < 0 else 0
+            result[k] = bit
+            parity ^= bit
+            if abs(llr[k]) < min_abs:
+                min_abs = abs(llr[k])
+                arg_min = k
+        result[arg_min] ^= parity
+
+
+# -----------------------------------------------------------------------------
+# Kernels for batches of frames
+#
+# Arrays of batch kernels have shape (N, B), so values of all the frames for
+# one position are contiguous and the inner loops run over the frames.
+# -----------------------------------------------------------------------------
+
+
+@numba.njit(cache=True, fastmath=True)
+def compute_left_alpha_batch(llr: np.array, result: np.array):
+    """Compute Alpha for left nodes of a batch in-place (min-sum f)."""
+    N = llr.shape[0] // 2
+    for i in range(N):
+        for b in range(llr.shape[1]):
+            x = llr[i, b]
+            y = llr[i + N, b]
+            magnitude = min(abs(x), abs(y))
+            result[i, b] = magnitude if (x >= 0) == (y >= 0) else -magnitude
+
+
+@numba.njit(cache=True, fastmath=True)
+def compute_right_alpha_batch(
+        llr: np.array,
+        left_beta: np.array,
+        result: np.array,
+):
+    """Compute Alpha for right nodes of a batch in-place (g function)."""
+    N = llr.shape[0] // 2
+    for i in range(N):
+        for b in range(llr.shape[1]):
+            if left_beta[i, b] == 0:
+                result[i, b] = llr[i + N, b] + llr[i, b]
+            else:
+                result[i, b] = llr[i + N, b] - llr[i, b]
+
+
+@numba.njit(cache=True)
+def compute_right_alpha_batch_quantized(
+        llr: np.array,
+        left_beta: np.array,
+        result: np.array,
+):
+    """Compute Alpha for right nodes of a batch in-place for quantized LLR.
+
+    The sum is saturated to [-QUANTIZED_LLR_MAX, QUANTIZED_LLR_MAX].
+
+    """
+    N = llr.shape[0] // 2
+    for i in range(N):
+        for b in range(llr.shape[1]):
+            x = np.int16(llr[i, b])
+            y = np.int16(llr[i + N, b])
+            value = y + x if left_beta[i, b] == 0 else y - x
+            result[i, b] = max(
+                -QUANTIZED_LLR_MAX, min(QUANTIZED_LLR_MAX, value),
+            )
+
+
+def right_alpha_batch_kernel(
+        llr: np.array,
+        left_beta: np.array,
+        result: np.array,
+):
+    """Compute Alpha for right nodes of a batch with the kernel for LLR type.
+
+    Inside compiled code the kernel is chosen during compilation.
+
+    """
+    if llr.dtype == np.int8:
+        compute_right_alpha_batch_quantized(llr, left_beta, result)
+    else:
+        compute_right_alpha_batch(llr, left_beta, result)
+
+
+@overload(right_alpha_batch_kernel)
+def _right_alpha_batch_kernel(llr, left_beta, result):
+    if llr.dtype == types.int8:
+        return lambda llr, left_beta, result: (
+            compute_right_alpha_batch_quantized(llr, left_beta, result)
+        )
+    return lambda llr, left_beta, result: compute_right_alpha_batch(
+        llr, left_beta, result,
+    )
+
+
+@numba.njit(cache=True)
+def compute_parent_beta_batch(
+        left: np.array,
+        right: np.array,
+        result: np.array,
+):
+    """Compute Beta values for parent nodes of a batch in-place."""
+    N = left.shape[0]
+    for i in range(N):
+        for b in range(left.shape[1]):
+            result[i, b] = left[i, b] ^ right[i, b]
+            result[i + N, b] = right[i, b]
+
+
+@numba.njit(cache=True)
+def make_hard_decision_batch(llr: np.array, result: np.array):
+    """Make hard decisions for One nodes of a batch in-place."""
+    for i in range(llr.shape[0]):
+        for b in range(llr.shape[1]):
+            result[i, b] = 1 if llr[i, b] < 0 else 0
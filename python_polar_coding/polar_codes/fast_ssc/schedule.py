@@ -0,0 +1,238 @@
+"""Flat decoding schedule of Fast SSC decoder.
+
+The schedule is a sequence of operations over Alpha and Beta values stored
+in contiguous per-level arrays. Each entry is a tuple of
+(opcode, level, offset, mask steps, last chunk type).
+
+"""
+from typing import Tuple
+
+import numba
+import numpy as np
+from anytree import PreOrderIter
+
+from python_polar_coding.polar_codes.base import NodeTypes
+from python_polar_coding.polar_codes.base.functions.beta_hard import (
+    make_hard_decision,
+)
+
+from .functions import (
+    compute_left_alpha_batch,
+    compute_parent_beta,
+    compute_parent_beta_batch,
+    g_repetition,
+    left_alpha_kernel,
+    make_hard_decision_batch,
+    repetition,
+    rg_parity,
+    right_alpha_batch_kernel,
+    right_alpha_kernel,
+    single_parity_check,
+)
+
+# Operation codes
+ALPHA_LEFT = 0
+ALPHA_RIGHT = 1
+LEAF_ONE = 2
+LEAF_SINGLE_PARITY_CHECK = 3
+LEAF_REPETITION = 4
+LEAF_G_REPETITION = 5
+LEAF_RG_PARITY = 6
+COMBINE = 7
+
+_leaf_opcodes = {
+    NodeTypes.ONE: LEAF_ONE,
+    NodeTypes.SINGLE_PARITY_CHECK: LEAF_SINGLE_PARITY_CHECK,
+    NodeTypes.REPETITION: LEAF_REPETITION,
+    NodeTypes.G_REPETITION: LEAF_G_REPETITION,
+    NodeTypes.RG_PARITY: LEAF_RG_PARITY,
+}
+
+
+def build_schedule(tree) -> Tuple:
+    """Build flat decoding schedule of the decoding tree.
+
+    Nodes are visited in depth-first order. Alpha of a non-root node is
+    computed from its parent (ALPHA_LEFT, ALPHA_RIGHT), a leaf computes its
+    Beta (LEAF_*), and after a right child is done its parent's Beta is
+    combined (COMBINE), going up while the node is a right child.
+
+    Zero nodes produce no operations besides combining, their Beta is
+    always a vector of zeros. Mask steps and last chunk type are set only
+    for generalized leaves and are zeros otherwise.
+
+    """
+    schedule = list()
+
+    for node in PreOrderIter(tree):
+        if node.is_zero:
+            _add_combine(node, schedule)
+            continue
+
+        if not node.is_root:
+            opcode = ALPHA_LEFT if node.is_left else ALPHA_RIGHT
+            schedule.append((opcode, node.level, node.offset, 0, 0))
+
+        if node.is_leaf:
+            opcode = _leaf_opcodes[node.node_type]
+            mask_steps, last_chunk_type = 0, 0
+            if opcode in (LEAF_G_REPETITION, LEAF_RG_PARITY):
+                mask_steps = node.mask_steps
+                last_chunk_type = node.last_chunk_type or 0
+
+            schedule.append((
+                opcode,
+                node.level,
+                node.offset,
+                mask_steps,
+                last_chunk_type,
+            ))
+            _add_combine(node, schedule)
+
+    return tuple(schedule)
+
+
+def _add_combine(node, schedule):
+    """Add combining of Beta values of the parents done on the node."""
+    while node.is_right:
+        node = node.parent
+        schedule.append((COMBINE, node.level, node.offset, 0, 0))
+
+
+def schedule_to_arrays(schedule: Tuple) -> Tuple[np.array, np.array]:
+    """Convert the schedule into arrays of opcodes and their parameters.
+
+    Parameters of each operation are (level, offset, mask steps, last chunk
+    type).
+
+    """
+    opcodes = np.array([entry[0] for entry in schedule], dtype=np.int32)
+    params = np.array(
+        [entry[1:] for entry in schedule], dtype=np.int64,
+    ).reshape(-1, 4)
+    return opcodes, params
+
+
+@numba.njit(cache=True)
+def run_schedule(
+        opcodes: np.array,
+        params: np.array,
+        alpha: np.array,
+        beta: np.array,
+):
+    """Run the decoding schedule over Alpha and Beta arrays.
+
+    The loop is compiled separately for floating point and quantized Alpha.
+
+    """
+    for k in range(opcodes.size):
+        opcode = opcodes[k]
+        level = params[k, 0]
+        offset = params[k, 1]
+        N = 1 << level
+        end = offset + N
+
+        if opcode == ALPHA_LEFT:
+            left_alpha_kernel(
+                alpha[level + 1, offset:end + N],
+                alpha[level, offset:end],
+            )
+        elif opcode == ALPHA_RIGHT:
+            start = offset - N
+            right_alpha_kernel(
+                alpha[level + 1, start:end],
+                beta[level, start:offset],
+                alpha[level, offset:end],
+            )
+        elif opcode == COMBINE:
+            middle = offset + N // 2
+            compute_parent_beta(
+                beta[level - 1, offset:middle],
+                beta[level - 1, middle:end],
+                beta[level, offset:end],
+            )
+        elif opcode == LEAF_ONE:
+            beta[level, offset:end] = make_hard_decision(
+                alpha[level, offset:end],
+            )
+        elif opcode == LEAF_SINGLE_PARITY_CHECK:
+            single_parity_check(
+                alpha[level, offset:end],
+                beta[level, offset:end],
+            )
+        elif opcode == LEAF_REPETITION:
+            repetition(alpha[level, offset:end], beta[level, offset:end])
+        elif opcode == LEAF_G_REPETITION:
+            g_repetition(
+                alpha[level, offset:end],
+                params[k, 2],
+                params[k, 3],
+                beta[level, offset:end],
+            )
+        elif opcode == LEAF_RG_PARITY:
+            rg_parity(
+                alpha[level, offset:end],
+                params[k, 2],
+                beta[level, offset:end],
+            )
+
+
+@numba.njit(cache=True)
+def run_schedule_batch(
+        opcodes: np.array,
+        params: np.array,
+        alpha: np.array,
+        beta: np.array,
+):
+    """Run the decoding schedule for a batch of frames.
+
+    Alpha and Beta arrays have shape (n + 1, N, B) with the frames on the
+    last axis. Alpha and Beta of inner nodes are computed for all the frames
+    at once, leaves are decoded frame by frame.
+
+    """
+    for k in range(opcodes.size):
+        opcode = opcodes[k]
+        level = params[k, 0]
+        offset = params[k, 1]
+        N = 1 << level
+        end = offset + N
+
+        if opcode == ALPHA_LEFT:
+            compute_left_alpha_batch(
+                alpha[level + 1, offset:end + N],
+                alpha[level, offset:end],
+            )
+        elif opcode == ALPHA_RIGHT:
+            start = offset - N
+            right_alpha_batch_kernel(
+                alpha[level + 1, start:end],
+                beta[level, start:offset],
+                alpha[level, offset:end],
+            )
+        elif opcode == COMBINE:
+            middle = offset + N // 2
+            compute_parent_beta_batch(
+                beta[level - 1, offset:middle],
+                beta[level - 1, middle:end],
+                beta[level, offset:end],
+            )
+        elif opcode == LEAF_ONE:
+            make_hard_decision_batch(
+                alpha[level, offset:end],
+                beta[level, offset:end],
+            )
+        else:
+            for b in range(alpha.shape[2]):
+                node_alpha = alpha[level, offset:end, b]
+                node_beta = beta[level, offset:end, b]
+                if opcode == LEAF_SINGLE_PARITY_CHECK:
+                    single_parity_check(node_alpha, node_beta)
+                elif opcode == LEAF_REPETITION:
+                    repetition(node_alpha, node_beta)
+                elif opcode == LEAF_G_REPETITION:
+                    g_repetition(
+                        node_alpha, params[k, 2], params[k, 3], node_beta,
+                    )
+                elif opcode == LEAF_RG_PARITY:
+                    rg_parity(node_alpha, params[k, 2], node_beta)
@@ -1,5 +1,7 @@
 from typing import Union
 
+import numpy as np
+
 from python_polar_coding.polar_codes.fast_ssc import FastSSCPolarCodec
 
 from .decoder import GFastSSCDecoder
@@ -21,6 +23,8 @@ class GFastSSCPolarCodec(FastSSCPolarCodec):
             mask: Union[str, None] = None,
             pcc_method: str = FastSSCPolarCodec.BHATTACHARYYA,
             AF: int = 0,
+            dtype: np.dtype = np.double,
+            llr_scale: float = GFastSSCDecoder.LLR_SCALE,
     ):
 
         self.AF = AF
@@ -30,10 +34,18 @@ class GFastSSCPolarCodec(FastSSCPolarCodec):
             design_snr=design_snr,
             mask=mask,
             pcc_method=pcc_method,
+            dtype=dtype,
+            llr_scale=llr_scale,
         )
 
     def init_decoder(self):
-        return self.decoder_class(n=self.n, mask=self.mask, AF=self.AF)
+        return self.decoder_class(
+            n=self.n,
+            mask=self.mask,
+            AF=self.AF,
+            dtype=self.dtype,
+            llr_scale=self.llr_scale,
+        )
 
     def to_dict(self):
         d = super().to_dict()
@@ -8,9 +8,23 @@ from .node import GFastSSCNode
 class GFastSSCDecoder(FastSSCDecoder):
     node_class = GFastSSCNode
 
-    def __init__(self, n: int, mask: np.array, AF: int = 0):
+    def __init__(
+            self,
+            n: int,
+            mask: np.array,
+            AF: int = 0,
+            dtype: np.dtype = np.double,
+            specialize: bool = False,
+            llr_scale: float = FastSSCDecoder.LLR_SCALE,
+    ):
         self.AF = AF
-        super().__init__(n=n, mask=mask)
+        super().__init__(
+            n=n,
+            mask=mask,
+            dtype=dtype,
+            specialize=specialize,
+            llr_scale=llr_scale,
+        )
 
     def _setup_decoding_tree(self):
         """Setup decoding tree."""
@@ -1,5 +1,4 @@
 import numpy as np
-from anytree import PreOrderIter
 
 from python_polar_coding.polar_codes.base import BaseTreeDecoder
 from python_polar_coding.polar_codes.base.functions import make_hard_decision
@@ -49,14 +48,14 @@ class RCSCANDecoder(BaseTreeDecoder):
         Run this before calling `__call__` method.
 
         """
-        for node in PreOrderIter(self._decoding_tree):
+        for node in self._nodes:
             if not (node.is_zero or node.is_one):
                 node.beta *= 0
 
     def _compute_intermediate_alpha(self, leaf):
         """Compute intermediate Alpha values (LLR)."""
-        for node in leaf.path[1:]:
-            if node.is_computed or node.is_zero or node.is_one:
+        for node in self._leaf_paths[leaf]:
+            if self._computed[node._id] or node.is_zero or node.is_one:
                 continue
 
             parent_alpha = node.parent.alpha
@@ -69,17 +68,22 @@ class RCSCANDecoder(BaseTreeDecoder):
                 left_beta = node.siblings[0].beta
                 node.alpha = compute_right_alpha(parent_alpha, left_beta)
 
-            node.is_computed = True
+            self._computed[node._id] = True
 
     def _compute_intermediate_beta(self, node):
-        """Compute intermediate BETA values."""
-        parent = node.parent
-        if node.is_left or node.is_root or parent.is_root:
-            return
+        """Compute intermediate BETA values.
 
-        left = node.siblings[0]
-        parent.beta = compute_parent_beta(left.beta, node.beta, parent.alpha)
-        return self._compute_intermediate_beta(parent)
+        BETA values of the parents are written in-place going up while the
+        node is a right child.
+
+        """
+        while node.is_right and not node.parent.is_root:
+            parent = node.parent
+            left = parent.children[0]
+            compute_parent_beta(
+                left.beta, node.beta, parent.alpha, parent.beta,
+            )
+            node = parent
 
     @property
     def result(self):
@@ -93,4 +97,6 @@ class RCSCANDecoder(BaseTreeDecoder):
             return self.root.beta
 
         left, right = self.root.children
-        return compute_parent_beta(left.beta, right.beta, alpha)
+        result = np.empty(alpha.size, dtype=np.double)
+        compute_parent_beta(left.beta, right.beta, alpha, result)
+        return result
@@ -50,15 +50,11 @@ def compute_right_alpha(parent_alpha, beta):
 
 
 @numba.njit
-def compute_parent_beta(left_beta, right_beta, parent_alpha):
-    """Compute bits of a parent Node."""
+def compute_parent_beta(left_beta, right_beta, parent_alpha, result):
+    """Compute bits of a parent Node in-place."""
     N = parent_alpha.size // 2
     left_parent_alpha = parent_alpha[:N]
     right_parent_alpha = parent_alpha[N:]
 
-    result = np.zeros(parent_alpha.size, dtype=np.double)
-
     result[:N] = function_1(left_beta, right_beta, right_parent_alpha)
     result[N:] = function_2(left_beta, left_parent_alpha, right_beta)
-
-    return result
@@ -0,0 +1,45 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+import numpy as np
+
+from python_polar_coding.polar_codes.fast_ssc import FastSSCDecoder, codegen
+from python_polar_coding.polar_codes.g_fast_ssc import GFastSSCNode
+
+
+class TestFastSSCCodegen(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patchers = [
+            mock.patch.object(codegen, 'CACHE_DIR', self.cache_dir.name),
+            mock.patch.object(codegen, '_decoders', dict()),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def test_decoder_is_written_to_cache(self):
+        mask = np.array([0, 0, 0, 1, 0, 1, 1, 1], dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, n=3, specialize=True)
+
+        files = [
+            f for f in os.listdir(self.cache_dir.name) if f.endswith('.py')
+        ]
+        self.assertEqual(len(files), 1)
+
+        with open(os.path.join(self.cache_dir.name, files[0])) as f:
+            self.assertEqual(
+                f.read(),
+                codegen.generate_source(decoder._schedule),
+            )
+
+    def test_decoder_is_reused_for_same_code(self):
+        mask = np.array([0, 0, 0, 1, 0, 1, 1, 1], dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, n=3, specialize=True)
+
+        GFastSSCNode(np.array([0, 0, 0, 0, 0, 0, 1, 1]))
+        other_decoder = FastSSCDecoder(mask=mask, n=3, specialize=True)
+        self.assertIs(other_decoder._decode_fn, decoder._decode_fn)
@@ -196,3 +196,108 @@ class TestFastSSCDecoder(TestCase):
             np.array([1, 1, 0, 0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 0, 0, 1, ],
                      dtype=np.int8)
         )
+
+    def test_quantized_decoder(self):
+        long_msg = np.array([
+             0.1139, 1.4662,  2.8427,  0.8675,  1.2576, -1.1791, 0.7535,  2.2528,
+            -0.3653, 0.6884, -0.9574, -0.2793, -0.8862, -1.7831, 1.7425, -3.0953,
+        ])
+        mask = np.array(
+            [1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, ], dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, n=4)
+        quantized_decoder = FastSSCDecoder(
+            mask=mask, n=4, dtype=np.int8, llr_scale=16,
+        )
+
+        np.testing.assert_equal(
+            quantized_decoder.decode(long_msg),
+            decoder.decode(long_msg),
+        )
+        np.testing.assert_equal(
+            quantized_decoder.result,
+            np.array([1, 1, 0, 0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 0, 0, 1, ],
+                     dtype=np.int8)
+        )
+
+    def test_wrong_llr_type(self):
+        mask = np.ones(self.length, dtype=np.int8)
+        with self.assertRaises(ValueError):
+            FastSSCDecoder(mask=mask, n=self.n, dtype=np.float32)
+
+    def test_batch_decoder(self):
+        mask = np.array([0, 0, 0, 1, 0, 1, 1, 1], dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, n=self.n)
+        llr_batch = np.array([
+            self.received_llr,
+            -self.received_llr,
+            self.received_llr[::-1],
+        ])
+
+        expected = [decoder.decode(llr) for llr in llr_batch]
+
+        np.testing.assert_equal(
+            decoder.decode_batch(llr_batch),
+            np.array(expected),
+        )
+
+    def test_specialized_decoder(self):
+        long_msg = np.array([
+             0.1139, 1.4662,  2.8427,  0.8675,  1.2576, -1.1791, 0.7535,  2.2528,
+            -0.3653, 0.6884, -0.9574, -0.2793, -0.8862, -1.7831, 1.7425, -3.0953,
+        ])
+        mask = np.array(
+            [1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, ], dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, n=4, specialize=True)
+
+        decoder.decode(long_msg)
+        np.testing.assert_equal(
+            decoder.result,
+            np.array([1, 1, 0, 0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 0, 0, 1, ],
+                     dtype=np.int8)
+        )
+
+    def test_specialized_zero_node_decoder(self):
+        mask = np.zeros(self.length, dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, n=self.n, specialize=True)
+
+        decoder.decode(self.received_llr)
+        np.testing.assert_equal(
+            decoder.result,
+            np.zeros(self.length, dtype=np.int8)
+        )
+
+    def test_specialized_one_node_decoder(self):
+        mask = np.ones(self.length, dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, n=self.n, specialize=True)
+
+        decoder.decode(self.received_llr)
+        np.testing.assert_equal(
+            decoder.result,
+            np.array(self.received_llr < 0, dtype=np.int8)
+        )
+
+    def test_decoded_result_is_not_overwritten(self):
+        mask = np.ones(self.length, dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, n=self.n)
+
+        decoded = decoder.decode(self.received_llr)
+        decoder.decode(-self.received_llr)
+        np.testing.assert_equal(
+            decoded,
+            np.array(self.received_llr < 0, dtype=np.int8)
+        )
+
+    def test_batch_decoder_with_several_chunks(self):
+        mask = np.array(
+            [1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, ], dtype=np.int8)
+        llr_batch = np.random.default_rng(7).normal(
+            size=(FastSSCDecoder.BATCH_SIZE + 5, mask.size),
+        )
+
+        for dtype in (np.double, np.int8):
+            decoder = FastSSCDecoder(mask=mask, n=4, dtype=dtype)
+            expected = [decoder.decode(llr) for llr in llr_batch]
+            np.testing.assert_equal(
+                decoder.decode_batch(llr_batch),
+                np.array(expected),
+            )
@@ -0,0 +1,125 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.base.functions import (
+    beta_hard,
+    compute_left_alpha,
+    compute_parent_beta_hard,
+)
+from python_polar_coding.polar_codes.fast_ssc import functions
+
+
+class TestFastSSCFunctions(TestCase):
+    """Compare in-place kernels of Fast SSC with functions of `beta_hard`."""
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(42)
+        cls.float_llrs = [rng.normal(size=2 ** i) for i in range(2, 7)]
+        # Small integer values give ties of LLR magnitudes
+        cls.int8_llrs = [
+            rng.integers(-3, 4, size=2 ** i).astype(np.int8)
+            for i in range(2, 7)
+        ]
+
+    @property
+    def llrs(self):
+        return self.float_llrs + self.int8_llrs
+
+    def test_left_alpha(self):
+        for llr in self.float_llrs:
+            result = np.empty(llr.size // 2)
+            functions.compute_left_alpha(llr, result)
+            np.testing.assert_equal(result, compute_left_alpha(llr))
+
+    def test_left_alpha_special_values(self):
+        # Ties of magnitudes, signed zeros and all the sign combinations
+        llr = np.array([
+            1.5, -1.5, 1.5, -1.5, 0.0, -0.0, 0.0, 2.0, -3.0,
+            1.5, 1.5, -1.5, -1.5, -0.0, 0.0, -2.0, 0.0, -0.5,
+        ])
+        result = np.empty(llr.size // 2)
+        functions.compute_left_alpha(llr, result)
+        np.testing.assert_equal(
+            result,
+            np.array([1.5, -1.5, -1.5, 1.5, 0.0, 0.0, 0.0, 0.0, 0.5]),
+        )
+        np.testing.assert_equal(result, compute_left_alpha(llr))
+
+    def test_parent_beta(self):
+        rng = np.random.default_rng(0)
+        # Halves of 4 bits use the scalar loop, of 8 and 64 bits uint64 lanes
+        for N in (4, 8, 64):
+            left = rng.integers(0, 2, N).astype(np.int8)
+            right = rng.integers(0, 2, N).astype(np.int8)
+            result = np.empty(2 * N, dtype=np.int8)
+            functions.compute_parent_beta(left, right, result)
+            np.testing.assert_equal(
+                result,
+                compute_parent_beta_hard(left, right),
+            )
+
+    def test_single_parity_check(self):
+        for llr in self.llrs:
+            result = np.empty(llr.size, dtype=np.int8)
+            functions.single_parity_check(llr, result)
+            np.testing.assert_equal(
+                result,
+                beta_hard.single_parity_check(llr),
+            )
+
+    def test_single_parity_check_ties(self):
+        llr = np.array([-1, 2, 1, -1, -3, 1], dtype=np.int8)
+        result = np.empty(llr.size, dtype=np.int8)
+        functions.single_parity_check(llr, result)
+        # Parity is fixed on the first position of the least reliable LLR
+        np.testing.assert_equal(result, np.array([0, 0, 0, 1, 1, 0]))
+        np.testing.assert_equal(result, beta_hard.single_parity_check(llr))
+
+    def test_repetition(self):
+        zero_sum_llr = np.array([-2, 1, 1, 0], dtype=np.int8)
+        for llr in self.llrs + [zero_sum_llr]:
+            result = np.empty(llr.size, dtype=np.int8)
+            functions.repetition(llr, result)
+            np.testing.assert_equal(result, beta_hard.repetition(llr))
+
+    def test_g_repetition(self):
+        for llr in self.llrs:
+            for mask_steps in self._get_mask_steps(llr.size):
+                for last_chunk_type in (0, 1):
+                    result = np.empty(llr.size, dtype=np.int8)
+                    functions.g_repetition(
+                        llr, mask_steps, last_chunk_type, result,
+                    )
+                    np.testing.assert_equal(
+                        result,
+                        beta_hard.g_repetition(
+                            llr, mask_steps, last_chunk_type,
+                        ),
+                    )
+
+    def test_rg_parity(self):
+        for llr in self.llrs:
+            for mask_steps in self._get_mask_steps(llr.size):
+                result = np.empty(llr.size, dtype=np.int8)
+                functions.rg_parity(llr, mask_steps, result)
+                np.testing.assert_equal(
+                    result,
+                    beta_hard.rg_parity(llr, mask_steps),
+                )
+
+    @staticmethod
+    def _get_mask_steps(N):
+        """Numbers of chunks of generalized nodes of size N."""
+        return [2 ** i for i in range(1, int(np.log2(N)))]
+
+    def test_right_alpha_quantized_saturation(self):
+        llr = np.array([
+            100, -100, 127, -127, 5,
+            100, -100, 127, 120, -3,
+        ], dtype=np.int8)
+        left_beta = np.array([0, 0, 1, 1, 1], dtype=np.int8)
+        result = np.empty(5, dtype=np.int8)
+        functions.compute_right_alpha_quantized(llr, left_beta, result)
+        np.testing.assert_equal(result, np.array([127, -127, 0, 127, -8]))
@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.fast_ssc import FastSSCNode
+from python_polar_coding.polar_codes.g_fast_ssc import GFastSSCNode
+from python_polar_coding.polar_codes.fast_ssc.schedule import (
+    ALPHA_LEFT,
+    ALPHA_RIGHT,
+    COMBINE,
+    LEAF_ONE,
+    LEAF_REPETITION,
+    LEAF_SINGLE_PARITY_CHECK,
+    build_schedule,
+)
+
+
+class FastSSCScheduleTest(TestCase):
+
+    def test_single_leaf(self):
+        node = FastSSCNode(np.array([0, 1, 1, 1, 1, 1, 1, 1]))
+        self.assertEqual(
+            build_schedule(node),
+            ((LEAF_SINGLE_PARITY_CHECK, 3, 0, 0, 0), ),
+        )
+
+    def test_two_leaves(self):
+        node = FastSSCNode(np.array([0, 0, 0, 1, 0, 1, 1, 1]))
+        self.assertEqual(build_schedule(node), (
+            (ALPHA_LEFT, 2, 0, 0, 0),
+            (LEAF_REPETITION, 2, 0, 0, 0),
+            (ALPHA_RIGHT, 2, 4, 0, 0),
+            (LEAF_SINGLE_PARITY_CHECK, 2, 4, 0, 0),
+            (COMBINE, 3, 0, 0, 0),
+        ))
+
+    def test_zero_leaves(self):
+        node = FastSSCNode(np.array([1, 0, 1, 0]))
+        self.assertEqual(build_schedule(node), (
+            (ALPHA_LEFT, 1, 0, 0, 0),
+            (ALPHA_LEFT, 0, 0, 0, 0),
+            (LEAF_ONE, 0, 0, 0, 0),
+            (COMBINE, 1, 0, 0, 0),
+            (ALPHA_RIGHT, 1, 2, 0, 0),
+            (ALPHA_LEFT, 0, 2, 0, 0),
+            (LEAF_ONE, 0, 2, 0, 0),
+            (COMBINE, 1, 2, 0, 0),
+            (COMBINE, 2, 0, 0, 0),
+        ))
+
+    def test_independent_of_other_trees(self):
+        mask = np.array([0, 0, 0, 1, 0, 1, 1, 1])
+        schedule = build_schedule(FastSSCNode(mask))
+
+        # Generalized nodes of another tree must not change the schedule
+        GFastSSCNode(np.array([0, 0, 0, 0, 0, 0, 1, 1]))
+        self.assertEqual(build_schedule(FastSSCNode(mask)), schedule)
@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import numpy as np
+
 from python_polar_coding.polar_codes.g_fast_ssc import GFastSSCPolarCodec
 from tests.base import BasicVerifyPolarCode
 
@@ -110,3 +112,16 @@ class TestGeneralizedFastSSCCode_1024_768_AF_3(BasicVerifyPolarCode, TestCase):
         'K': 768,
         'AF': 3,
     }
+
+
+class TestGeneralizedFastSSCCode_1024_512_AF_1_Quantized(
+        BasicVerifyPolarCode,
+        TestCase,
+):
+    polar_code_class = GFastSSCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'AF': 1,
+        'dtype': np.int8,
+    }
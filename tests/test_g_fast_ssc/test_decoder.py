@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.g_fast_ssc import (
+    GFastSSCDecoder,
+    GFastSSCPolarCodec,
+)
+
+
+class TestGFastSSCDecoder(TestCase):
+
+    def test_quantized_decoder(self):
+        code = GFastSSCPolarCodec(N=64, K=32, AF=1)
+        decoder = GFastSSCDecoder(n=code.n, mask=code.mask, AF=1)
+        quantized_decoder = GFastSSCDecoder(
+            n=code.n, mask=code.mask, AF=1, dtype=np.int8, llr_scale=1,
+        )
+
+        # LLR of +1 and -1 are quantized exactly and no sum of them exceeds
+        # the saturation limit for N = 64, so both decoders give the same bits
+        llr_batch = np.random.default_rng(3).choice([-1.0, 1.0], (20, 64))
+        for llr in llr_batch:
+            np.testing.assert_equal(
+                quantized_decoder.decode(llr),
+                decoder.decode(llr),
+            )
+        np.testing.assert_equal(
+            quantized_decoder.decode_batch(llr_batch),
+            decoder.decode_batch(llr_batch),
+        )
@@ -61,4 +61,4 @@ class TestRCSCANNode(TestCase):
         for i, leaf in enumerate(node.leaves):
             self.assertEqual(len(leaf.path), leaf_path_lengths[i])
             np.testing.assert_equal(leaf.mask, leaf_masks[i])
-            self.assertTrue(leaf.node_type, leaf_types[i])
+            self.assertEqual(leaf.node_type, leaf_types[i])